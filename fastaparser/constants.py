@@ -47,6 +47,8 @@ NUCLEOTIDE_LETTER_CODES_COMPLEMENT = {
     "V": "B",
     "-": "-",
 }
+# str.translate table (other letter codes stay the same)
+_NUCLEOTIDE_COMPLEMENT_TRANSLATION = str.maketrans(NUCLEOTIDE_LETTER_CODES_COMPLEMENT)
 
 # AMINOACID DICTIONARIES
 AMINOACID_LETTER_CODES_GOOD = {
@@ -83,19 +85,15 @@ LETTER_CODES = {
     "nucleotide": (NUCLEOTIDE_LETTER_CODES_GOOD, NUCLEOTIDE_LETTER_CODES_DEGENERATE),
     "aminoacid": (AMINOACID_LETTER_CODES_GOOD, AMINOACID_LETTER_CODES_DEGENERATE),
 }
+_SEQUENCE_TYPES = frozenset(LETTER_CODES)  # valid sequence types, besides None
 
 # set operations
-LETTER_CODES_ALL = set(
-    list(NUCLEOTIDE_LETTER_CODES_GOOD)
-    + list(NUCLEOTIDE_LETTER_CODES_DEGENERATE)
-    + list(AMINOACID_LETTER_CODES_GOOD)
-    + list(AMINOACID_LETTER_CODES_DEGENERATE)
+NUCLEOTIDE_LETTER_CODES_ALL = frozenset(NUCLEOTIDE_LETTER_CODES_GOOD).union(
+    NUCLEOTIDE_LETTER_CODES_DEGENERATE
 )
-NUCLEOTIDE_LETTER_CODES_ALL = set(
-    list(NUCLEOTIDE_LETTER_CODES_GOOD) + list(NUCLEOTIDE_LETTER_CODES_DEGENERATE)
-)
-AMINOACID_LETTER_CODES_ALL = set(
-    list(AMINOACID_LETTER_CODES_GOOD) + list(AMINOACID_LETTER_CODES_DEGENERATE)
+AMINOACID_LETTER_CODES_ALL = frozenset(AMINOACID_LETTER_CODES_GOOD).union(
+    AMINOACID_LETTER_CODES_DEGENERATE
 )
+LETTER_CODES_ALL = NUCLEOTIDE_LETTER_CODES_ALL | AMINOACID_LETTER_CODES_ALL
 AMINOACIDS_NOT_IN_NUCLEOTIDES = AMINOACID_LETTER_CODES_ALL - NUCLEOTIDE_LETTER_CODES_ALL
 # nucleotides_not_in_aminoacids would be empty
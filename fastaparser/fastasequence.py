@@ -5,14 +5,84 @@
 FastaSequence - Represents a single DNA/RNA/aminoacid FASTA sequence.
 """
 
+import operator
+import sys
 import warnings
-from .constants import LETTER_CODES, AMINOACIDS_NOT_IN_NUCLEOTIDES
-from .lettercode import LetterCode
+from collections import Counter
+from collections.abc import Sequence
+from itertools import repeat
+from .constants import (
+    LETTER_CODES,
+    AMINOACIDS_NOT_IN_NUCLEOTIDES,
+    _NUCLEOTIDE_COMPLEMENT_TRANSLATION,
+    _SEQUENCE_TYPES,
+)
+from .lettercode import _SHARED_LETTER_CODES
 
 
-warnings.simplefilter(
-    "always"
-)  # show warnings everytime instead of only the first time they happen
+_SEQUENCE_TYPE_ERROR = "sequence_type must be one of: '%s' or None" % "', '".join(
+    LETTER_CODES
+)
+
+
+class _LetterCodeSequence(Sequence):
+    """
+    Read-only view of a sequence string as a sequence of LetterCode objects.
+    LetterCode objects are only retrieved when accessed and are shared (see lettercode._SharedLetterCodes),
+    so the view itself costs the same independently of the sequence length.
+    Slicing returns a list of LetterCode objects.
+    """
+
+    __slots__ = ("_sequence", "_sequence_type")
+
+    def __init__(self, sequence, sequence_type):
+        """
+        Parameters
+        ----------
+        sequence : str
+            Upper case sequence.
+        sequence_type : 'nucleotide', 'aminoacid' or None
+            Type of the LetterCode objects.
+        """
+        self._sequence = sequence
+        self._sequence_type = sequence_type
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [
+                _SHARED_LETTER_CODES[letter_code, self._sequence_type]
+                for letter_code in self._sequence[item]
+            ]
+        return _SHARED_LETTER_CODES[self._sequence[item], self._sequence_type]
+
+    # map() and zip() iterate in C, instead of a python generator
+    def __iter__(self):
+        return map(
+            _SHARED_LETTER_CODES.__getitem__,
+            zip(self._sequence, repeat(self._sequence_type)),
+        )
+
+    def __reversed__(self):
+        return map(
+            _SHARED_LETTER_CODES.__getitem__,
+            zip(reversed(self._sequence), repeat(self._sequence_type)),
+        )
+
+    def __len__(self):
+        return len(self._sequence)
+
+    def __eq__(self, other):
+        """
+        Equal to another view of the same sequence or to a list of the same LetterCode objects.
+        """
+        if isinstance(other, _LetterCodeSequence):
+            return self._sequence == other._sequence
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
 
 
 class FastaSequence:
@@ -26,8 +96,8 @@ class FastaSequence:
         ID portion of the definition line (header). Can be empty.
     description : str
         Description portion of the definition line (header). Can be empty.
-    sequence : list of LetterCode
-        Sequence.
+    sequence : sequence of LetterCode
+        Sequence (read-only). LetterCode objects are built on access and can't be modified.
     sequence_type : 'nucleotide', 'aminoacid' or None
         Indicates the type of sequence ('aminoacid' or 'nucleotide'). Can be None if not known.
     inferred_type: bool
@@ -75,6 +145,20 @@ class FastaSequence:
         When calling __getitem__, if item is not an int/slice or the sliced sequence is empty.
     """
 
+    __slots__ = (
+        "_id",
+        "_description",
+        "_sequence_str",
+        "_sequence_type",
+        "_inferred_type",
+        "_letter_code_counts",
+        "_current_iterator",
+        "_gc",
+        "_at",
+    )
+    # number of sequence lines per block yielded by _iter_formatted_fasta
+    _LINES_PER_BLOCK = 1024
+
     def __init__(
         self, sequence, id_="", description="", sequence_type=None, infer_type=False
     ):
@@ -107,28 +191,89 @@ class FastaSequence:
         """
         self._update_id(id_)
         self._update_description(description)
-        self._update_sequence_type(sequence_type, update_letter_code_objects=False)
+        self._update_sequence_type(sequence_type)
 
         if isinstance(sequence, str) and len(sequence) > 0:
             if isinstance(infer_type, bool):
-                if infer_type:
-                    self._sequence_type = self._infer_sequence_type(sequence)
-                    # if infer_type is False there is no need to set _inferred_type as False
-                    # as it is already set as such in _update_sequence_type
+                self._init_sequence(sequence, infer_type)
             else:
                 raise TypeError("infer_type must be bool")
-
-            # _sequence = [LetterCode, ...]
-            # _counts = {letter: count, ...}
-            self._sequence, self._counts = self._build_letter_code_sequence_and_counts(
-                sequence
-            )
         else:
             raise TypeError("sequence must be a non empty str")
 
-        self._current_iterator = None
-        self._gc = None
-        self._at = None
+    @classmethod
+    def _from_reader(cls, sequence, id_, description, sequence_type, infer_type):
+        """
+        Alternate __init__ method used by Reader, which skips the checks Reader already made.
+        sequence_type and infer_type were validated when initializing Reader and id_ and description were
+        parsed from a definition line (id_ has no whitespace and description has no newlines).
+
+        Parameters
+        ----------
+        sequence : str
+            String of characters representing a DNA, RNA or aminoacid sequence.
+        id_ : str
+            ID portion of the definition line (header).
+        description : str
+            Description portion of the definition line (header).
+        sequence_type : 'nucleotide', 'aminoacid' or None
+            Indicates the type of sequence ('aminoacid' or 'nucleotide').
+        infer_type : bool
+            Indicates if FastaSequence should try to infer aminoacid sequence type.
+
+        Returns
+        -------
+        FastaSequence
+
+        Raises
+        ------
+        TypeError
+            If sequence is empty.
+        """
+        if not sequence:
+            raise TypeError("sequence must be a non empty str")
+
+        fasta_sequence = cls.__new__(cls)
+        # same as _update_id and _update_description
+        fasta_sequence._id = sys.intern(id_[1:] if id_.startswith(">") else id_)
+        fasta_sequence._description = " ".join(description.split())
+        fasta_sequence._sequence_type = sequence_type
+        fasta_sequence._inferred_type = False
+        fasta_sequence._init_sequence(sequence, infer_type)
+        return fasta_sequence
+
+    @classmethod
+    def _from_normalized(cls, sequence_str, id_, description, sequence_type):
+        """
+        Alternate __init__ method used for copies, slices and complements, whose values come from an
+        already initialized FastaSequence (so nothing is checked, cleaned up or upper cased again).
+
+        Parameters
+        ----------
+        sequence_str : str
+            Non empty upper case sequence.
+        id_ : str
+            ID portion of the definition line (header), as stored by FastaSequence.
+        description : str
+            Description portion of the definition line (header), as stored by FastaSequence.
+        sequence_type : 'nucleotide', 'aminoacid' or None
+            Indicates the type of sequence ('aminoacid' or 'nucleotide').
+
+        Returns
+        -------
+        FastaSequence
+        """
+        fasta_sequence = cls.__new__(cls)
+        fasta_sequence._id = id_
+        fasta_sequence._description = description
+        fasta_sequence._sequence_type = sequence_type
+        fasta_sequence._inferred_type = False
+        fasta_sequence._sequence_str = sequence_str
+        fasta_sequence._letter_code_counts = None
+        fasta_sequence._current_iterator = None
+        fasta_sequence._gc = None
+        fasta_sequence._at = None
+        return fasta_sequence
 
     @classmethod
     def from_fastasequence(cls, fastasequence):
@@ -151,11 +296,12 @@ class FastaSequence:
             If fastasequence is of the wrong type.
         """
         if isinstance(fastasequence, FastaSequence):
-            return cls(
-                fastasequence.sequence_as_string(),
-                fastasequence.id,
-                fastasequence.description,
-                fastasequence.sequence_type,
+            # pylint: disable=protected-access
+            return cls._from_normalized(
+                fastasequence._sequence_str,
+                fastasequence._id,
+                fastasequence._description,
+                fastasequence._sequence_type,
             )
         raise TypeError("fastasequence must be a FastaSequence")
 
@@ -226,6 +372,18 @@ class FastaSequence:
         """return sequence."""
         return self._sequence
 
+    @property
+    def _sequence(self):
+        """Lazy view of the sequence as LetterCode objects."""
+        return _LetterCodeSequence(self._sequence_str, self._sequence_type)
+
+    @property
+    def _counts(self):
+        """Letter code counts ({letter: count, ...}), computed the first time they are needed."""
+        if self._letter_code_counts is None:
+            self._letter_code_counts = self._count_letter_codes(self._sequence_str)
+        return self._letter_code_counts
+
     @property
     def sequence_type(self):
         """return sequence_type."""
@@ -295,25 +453,23 @@ class FastaSequence:
             if self._sequence_type is None:
                 warnings.warn(
                     "sequence_type is not explicitly 'nucleotide'. "
-                    "Therefore, the complementary sequence might not make sense."
+                    "Therefore, the complementary sequence might not make sense.",
+                    stacklevel=2,
                 )
             if reverse:
-                complement_sequence = "".join(
-                    [
-                        letter.complement().letter_code
-                        for letter in reversed(self._sequence)
-                    ]
+                complement_sequence = self._sequence_str[::-1].translate(
+                    _NUCLEOTIDE_COMPLEMENT_TRANSLATION
                 )
                 reversed_text = "REVERSE "
             else:
-                complement_sequence = "".join(
-                    [letter.complement().letter_code for letter in self._sequence]
+                complement_sequence = self._sequence_str.translate(
+                    _NUCLEOTIDE_COMPLEMENT_TRANSLATION
                 )
                 reversed_text = ""
 
             space = " " if len(self._description) > 0 else ""
             complement_description = "%s[%sCOMPLEMENT]" % (space, reversed_text)
-            return FastaSequence(
+            return FastaSequence._from_normalized(
                 complement_sequence,
                 self._id,
                 self._description + complement_description,
@@ -354,20 +510,13 @@ class FastaSequence:
         if self._sequence_type is None:
             warnings.warn(
                 "sequence_type is not explicitly 'nucleotide'. "
-                "Therefore, the calculated GC content might not make sense."
+                "Therefore, the calculated GC content might not make sense.",
+                stacklevel=2,
             )
         if isinstance(as_percentage, bool):
-            if not self._gc:  # if gc_content was not called before
-                gc = 0
-                for letter_code in self._sequence:
-                    if letter_code.letter_code in (
-                        "G",
-                        "C",
-                        "S",
-                    ):  # S means either G or C
-                        gc += 1
-                self._gc = gc
-            gc_content = self._gc / len(self._sequence)
+            if self._gc is None:  # if gc_content was not called before
+                self._gc = self._count_in_sequence("GCS")  # S means either G or C
+            gc_content = self._gc / len(self._sequence_str)
             return gc_content * 100 if as_percentage else gc_content
         raise TypeError("as_percentage must be a bool")
 
@@ -398,28 +547,13 @@ class FastaSequence:
         if self._sequence_type is None:
             warnings.warn(
                 "sequence_type is not explicitly 'nucleotide'. "
-                "Therefore, the calculated AT/GC ratio might not make sense."
+                "Therefore, the calculated AT/GC ratio might not make sense.",
+                stacklevel=2,
             )
-        if not self._at or not self._gc:  # if at_gc_ratio was not called before
-            at = 0
-            gc = 0
-            for letter_code in self._sequence:
-                if self._at is None and letter_code.letter_code in (
-                    "A",
-                    "T",
-                    "W",
-                ):  # W means either A or T
-                    at += 1
-                elif self._gc is None and letter_code.letter_code in (
-                    "G",
-                    "C",
-                    "S",
-                ):  # S means either G or C
-                    gc += 1
-            if self._gc is None:
-                self._gc = gc
-            if self._at is None:
-                self._at = at
+        if self._gc is None:  # if gc_content or at_gc_ratio were not called before
+            self._gc = self._count_in_sequence("GCS")  # S means either G or C
+        if self._at is None:  # if at_gc_ratio was not called before
+            self._at = self._count_in_sequence("ATW")  # W means either A or T
         return self._at / self._gc if self._gc != 0 else 0
 
     def count_letter_codes(self, letter_codes=None):
@@ -464,10 +598,11 @@ class FastaSequence:
             If self._sequence_type is not explicitly defined.
         """
         if self._sequence_type in LETTER_CODES:
+            degenerate_letter_codes = LETTER_CODES[self._sequence_type][1]
             return {
                 letter: counts
                 for letter, counts in self._counts.items()
-                if letter in LETTER_CODES[self._sequence_type][1]
+                if letter in degenerate_letter_codes
             }
 
         raise TypeError(
@@ -517,16 +652,15 @@ class FastaSequence:
                 1 if max_characters_per_line <= 0 else max_characters_per_line
             )
 
-            current_character_count = 0
-            final_sequence = ""
-            while current_character_count < len(self._sequence):
-                temp_sequence = self._sequence[
-                    current_character_count : current_character_count
-                    + max_characters_per_line
+            # lines are sliced directly from the sequence string and joined all at once
+            return "\n".join(
+                [
+                    self._sequence_str[start : start + max_characters_per_line]
+                    for start in range(
+                        0, len(self._sequence_str), max_characters_per_line
+                    )
                 ]
-                final_sequence += "".join(map(str, temp_sequence)) + "\n"
-                current_character_count += max_characters_per_line
-            return final_sequence[:-1]  # remove last '\n'
+            )
         raise TypeError("max_characters_per_line must be an int")
 
     def formatted_fasta(self):
@@ -540,17 +674,43 @@ class FastaSequence:
         """
         return self.formatted_definition_line() + "\n" + self.formatted_sequence()
 
+    def _iter_formatted_fasta(self, max_characters_per_line=70):
+        """
+        Formatted FASTA (definition line and sequence), in blocks of _LINES_PER_BLOCK lines.
+        Same as formatted_fasta() + '\n', without building the whole formatted FASTA at once.
+
+        Parameters
+        ----------
+        max_characters_per_line : int, optional
+            Maximum number of characters per sequence line (must be greater than 0).
+
+        Yields
+        ------
+        str
+            Definition line or block of sequence lines, all lines ending with '\n'.
+        """
+        yield self.formatted_definition_line() + "\n"
+
+        block_size = max_characters_per_line * self._LINES_PER_BLOCK
+        for block_start in range(0, len(self._sequence_str), block_size):
+            block_end = min(block_start + block_size, len(self._sequence_str))
+            yield "\n".join(
+                [
+                    self._sequence_str[start : start + max_characters_per_line]
+                    for start in range(block_start, block_end, max_characters_per_line)
+                ]
+            ) + "\n"
+
     def sequence_as_string(self):
         """
         Returns the sequence as string.
-        Converts the list of LetterCode objects to a single string.
 
         Returns
         -------
         str
             Sequence as string.
         """
-        return "".join(map(str, self._sequence))
+        return self._sequence_str
 
     def reverse(self):
         """
@@ -564,6 +724,38 @@ class FastaSequence:
         """
         return reversed(self)
 
+    def _init_sequence(self, sequence, infer_type):
+        """
+        Initializes the sequence and everything derived from it (called by __init__ and _from_reader).
+
+        Parameters
+        ----------
+        sequence : str
+            Non empty string of characters representing a DNA, RNA or aminoacid sequence.
+        infer_type : bool
+            Indicates if FastaSequence should try to infer aminoacid sequence type.
+        """
+        # the upper case string is the sequence itself, LetterCode objects are only built on access
+        self._sequence_str = sequence.upper()
+        if len(self._sequence_str) != len(sequence):  # ex: 'ß'.upper() == 'SS'
+            raise TypeError(
+                "sequence can't have characters whose upper case is not a single character"
+            )
+
+        if infer_type:
+            sequence_type, self._inferred_type = self._infer_sequence_type(
+                self._sequence_str
+            )
+            if self._inferred_type:  # keeps the already set value otherwise
+                self._sequence_type = sequence_type
+
+        # letter code counts are only computed when first needed (see _counts)
+        self._letter_code_counts = None
+
+        self._current_iterator = None
+        self._gc = None
+        self._at = None
+
     def _update_id(self, id_):
         """
         Updates ID portion of the definition line (header).
@@ -581,12 +773,14 @@ class FastaSequence:
             If id_ is not str.
         """
         if isinstance(id_, str):
-            id_ = "".join(
-                id_.strip().replace(" ", "_").split()
-            )  # remove spaces and newlines
+            # space is the only whitespace isprintable() accepts, most ids have none
+            if " " in id_ or not id_.isprintable():
+                id_ = "".join(
+                    id_.strip().replace(" ", "_").split()
+                )  # remove spaces and newlines
             if id_.startswith(">"):  # remove '>' if any
                 id_ = id_[1:]
-            self._id = id_
+            self._id = sys.intern(str(id_))  # str subclasses can't be interned
         else:
             raise TypeError("id_ must be str")
 
@@ -613,7 +807,7 @@ class FastaSequence:
         else:
             raise TypeError("description must be str")
 
-    def _update_sequence_type(self, sequence_type, update_letter_code_objects=True):
+    def _update_sequence_type(self, sequence_type):
         """
         Updates sequence_type and all other relevant properties as needed.
 
@@ -621,55 +815,56 @@ class FastaSequence:
         ----------
         sequence_type : 'nucleotide', 'aminoacid' or None
             'nucleotide' or 'aminoacid' type sequence, None if there is no information.
-        update_letter_code_objects : bool
-            Should LetterCode objects be updated with sequence_type or not.
 
         Raises
         ------
         TypeError
-            If sequence_type or update_letter_code_objects are of the wrong type.
+            If sequence_type is of the wrong type.
         """
-        if (
-            isinstance(sequence_type, str) and sequence_type in LETTER_CODES
-        ) or sequence_type is None:
+        if sequence_type is None or (
+            isinstance(sequence_type, str) and sequence_type in _SEQUENCE_TYPES
+        ):
             self._sequence_type = sequence_type
             self._inferred_type = False
         else:
-            raise TypeError(
-                "sequence_type must be one of: '%s' or None" % "', '".join(LETTER_CODES)
-            )
-        if isinstance(update_letter_code_objects, bool):
-            if update_letter_code_objects:
-                for letter_code_object in self._sequence:  # update LetterCode objects
-                    letter_code_object.letter_type = self._sequence_type
-        else:
-            raise TypeError("update_letter_code_objects must be a bool")
+            raise TypeError(_SEQUENCE_TYPE_ERROR)
 
-    def _build_letter_code_sequence_and_counts(self, string_sequence):
+    @staticmethod
+    def _count_letter_codes(string_sequence):
         """
-        Iterates over the sequence and builds a list of LetterCode objects while counting the number of letter codes.
+        Counts the number of occurrences of each letter code.
 
         Parameters
         ----------
         string_sequence: str
-            String of characters representing a DNA, RNA or aminoacid sequence.
+            Upper case string of characters representing a DNA, RNA or aminoacid sequence.
 
         Returns
         -------
-        (list of LetterCode, dict of letter code counts)
-        """
-        letter_code_list = []
-        letter_code_count_dict = {}
-        for letter_code in string_sequence:
-            letter_code = letter_code.upper()
-            letter_code_list.append(LetterCode(letter_code, self._sequence_type))
-            letter_code_count_dict[letter_code] = (
-                letter_code_count_dict.setdefault(letter_code, 0) + 1
-            )
+        dict of letter code counts
+        """
+        # Counter counts in C, instead of a python loop over every letter code
+        return dict(Counter(string_sequence))
+
+    def _count_in_sequence(self, letter_codes):
+        """
+        Counts the total number of occurrences of the given letter codes in the sequence.
+        Uses the cached letter code counts, so the sequence is scanned at most once.
 
-        return letter_code_list, letter_code_count_dict
+        Parameters
+        ----------
+        letter_codes : str
+            Upper case letter codes to count.
+
+        Returns
+        -------
+        int
+            Total number of occurrences.
+        """
+        return sum(self._counts.get(letter_code, 0) for letter_code in letter_codes)
 
-    def _infer_sequence_type(self, string_sequence):
+    @staticmethod
+    def _infer_sequence_type(string_sequence):
         """
         Tries to infer aminoacid sequence type.
         Tests for the presence of letter codes that can only represent aminoacids
@@ -681,31 +876,25 @@ class FastaSequence:
         Parameters
         ----------
         string_sequence: str
-            String of characters representing a DNA, RNA or aminoacid sequence.
+            Upper case string of characters representing a DNA, RNA or aminoacid sequence.
 
         Returns
         -------
-        'aminoacid' or existing value (can be None)
-            Inferred type 'aminoacid', existing value otherwise.
+        tuple('aminoacid', True) or tuple(None, False)
+            Inferred type and whether the type could be inferred at all.
         """
-        for letter_code in string_sequence:
-            if letter_code in AMINOACIDS_NOT_IN_NUCLEOTIDES:
-                self._inferred_type = True
-                return "aminoacid"
-        # self._inferred_type = False  # _inferred_type is already False when this function is called in __init__
-        return self._sequence_type  # returns the already set value
+        # each substring search scans the sequence in C (and stops at the first match),
+        # instead of checking every letter code in a python loop
+        if any(map(string_sequence.__contains__, AMINOACIDS_NOT_IN_NUCLEOTIDES)):
+            return "aminoacid", True
+        return None, False
 
     def __iter__(self):
         """
         Iterates over the sequence.
         Returns a new iterator of the sequence (from the beginning) every time __iter__ is called.
         """
-
-        def iter_sequence():
-            for letter_code in self._sequence:
-                yield letter_code
-
-        self._current_iterator = iter_sequence()
+        self._current_iterator = iter(self._sequence)
         return self._current_iterator
 
     def __reversed__(self):
@@ -713,12 +902,7 @@ class FastaSequence:
         Iterates over the sequence in reverse.
         Returns a new iterator of the reversed sequence (from the end) every time __reversed__ is called.
         """
-
-        def iter_sequence_reversed():
-            for letter_code in reversed(self._sequence):
-                yield letter_code
-
-        self._current_iterator = iter_sequence_reversed()
+        self._current_iterator = reversed(self._sequence)
         return self._current_iterator
 
     def __next__(self):
@@ -740,6 +924,7 @@ class FastaSequence:
         Parameters
         ----------
         item : int or slice
+            Also accepts any other object that can be used as an integer index (ex: numpy integers).
 
         Returns
         -------
@@ -748,10 +933,8 @@ class FastaSequence:
             or
             FastaSequence with a sliced sequence of LetterCode objects.
         """
-        if isinstance(item, int):
-            return self._sequence[item]
         if isinstance(item, slice):
-            new_sequence = self.sequence_as_string()[item]
+            new_sequence = self._sequence_str[item]
             if len(new_sequence) == 0:
                 raise TypeError(
                     "Slice resulted in an empty sequence. FastaSequence must have a non-empty sequence"
@@ -766,10 +949,14 @@ class FastaSequence:
                 if self.description
                 else slice_text
             )
-            return FastaSequence(
-                new_sequence, self.id, new_description, self.sequence_type
+            return FastaSequence._from_normalized(
+                new_sequence, self._id, new_description, self._sequence_type
             )
-        raise TypeError("Indices must be integers or slices")
+        try:
+            index = operator.index(item)
+        except TypeError:
+            raise TypeError("Indices must be integers or slices") from None
+        return _SHARED_LETTER_CODES[self._sequence_str[index], self._sequence_type]
 
     def __eq__(self, other):
         """
@@ -778,15 +965,15 @@ class FastaSequence:
         A FastaSequence is equal to a list if it represents the same LetterCode sequence.
         """
         if isinstance(other, FastaSequence):
-            return self._sequence == other.sequence
+            return self._sequence_str == other._sequence_str
         if isinstance(other, str):
-            return self.sequence_as_string() == other
+            return self._sequence_str == other
         if isinstance(other, list):
             return self._sequence == other
-        return False
+        return NotImplemented
 
     def __len__(self):
-        return len(self._sequence)
+        return len(self._sequence_str)
 
     def __repr__(self):
         return "FastaSequence(%r)" % self.sequence_as_string()
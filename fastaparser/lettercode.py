@@ -9,13 +9,19 @@ import warnings
 from .constants import (
     LETTER_CODES,
     LETTER_CODES_ALL,
-    NUCLEOTIDE_LETTER_CODES_COMPLEMENT,
+    _NUCLEOTIDE_COMPLEMENT_TRANSLATION,
 )
 
 
-warnings.simplefilter(
-    "always"
-)  # show warnings everytime instead of only the first time they happen
+# (letter_code, letter_type) -> (description, degenerate, supported), for letter codes of each letter_type
+_LETTER_CODE_PROPERTIES = {
+    (letter_code, letter_type): (description, degenerate, True)
+    for letter_type, letter_codes in LETTER_CODES.items()
+    for degenerate, letter_codes_descriptions in zip((False, True), letter_codes)
+    for letter_code, description in letter_codes_descriptions.items()
+}
+# properties of letter codes not defined for the letter_type (or when letter_type is None)
+_UNSUPPORTED_LETTER_CODE_PROPERTIES = ("", None, False)
 
 
 class LetterCode:
@@ -52,9 +58,19 @@ class LetterCode:
         When calling __init__, if letter_code or letter_type are of the wrong type.
         When calling from_lettercode(), if lettercode is of the wrong type.
         When setting letter_type, if letter_type_value is of the wrong type.
+        When setting or deleting letter_type, if the LetterCode is shared (ie, retrieved from a FastaSequence).
         When calling complement(), if letter_type is 'aminoacid'.
     """
 
+    __slots__ = (
+        "_letter_code",
+        "_letter_type",
+        "_degenerate",
+        "_supported",
+        "_in_fasta_spec",
+        "_shared",
+    )
+
     def __init__(self, letter_code, letter_type=None):
         """
         Initializes given letter code.
@@ -71,6 +87,9 @@ class LetterCode:
         TypeError
             If letter_code or letter_type are of the wrong type.
         """
+        # shared LetterCode objects (see _SharedLetterCodes) can't be modified
+        self._shared = False
+
         if isinstance(letter_code, str) and len(letter_code) == 1:
             self._letter_code = letter_code.upper()
             self._in_fasta_spec = self._letter_code in LETTER_CODES_ALL
@@ -100,7 +119,8 @@ class LetterCode:
             If lettercode is of the wrong type.
         """
         if isinstance(lettercode, LetterCode):
-            return cls(lettercode.letter_code, lettercode.letter_type)
+            # lettercode was already initialized, so there is no need to go through __init__ again
+            return lettercode._copy(cls)  # pylint: disable=protected-access
         raise TypeError("lettercode must be a LetterCode")
 
     @property
@@ -127,26 +147,30 @@ class LetterCode:
         ------
         TypeError
             If letter_type_value is of the wrong type.
+            If the LetterCode is shared.
         """
+        self._check_not_shared()
         self._update_letter_type(letter_type_value)
 
     @letter_type.deleter
     def letter_type(self):
         """
         Sets letter_type to the default value (None) and updates all other relevant properties as needed.
+
+        Raises
+        ------
+        TypeError
+            If the LetterCode is shared.
         """
+        self._check_not_shared()
         self._update_letter_type(None)
 
     @property
     def description(self):
         """return description."""
-        description = ""
-        if self._letter_type in LETTER_CODES:
-            if self._letter_code in LETTER_CODES[self._letter_type][0]:  # good
-                description = LETTER_CODES[self._letter_type][0][self._letter_code]
-            elif self._letter_code in LETTER_CODES[self._letter_type][1]:  # degenerate
-                description = LETTER_CODES[self._letter_type][1][self._letter_code]
-        return description
+        return _LETTER_CODE_PROPERTIES.get(
+            (self._letter_code, self._letter_type), _UNSUPPORTED_LETTER_CODE_PROPERTIES
+        )[0]
 
     @property
     def degenerate(self):
@@ -191,14 +215,54 @@ class LetterCode:
         if self._letter_type is None:
             warnings.warn(
                 "letter_type is not explicitly 'nucleotide'. "
-                "Therefore, the complementary letter code might not make sense."
+                "Therefore, the complementary letter code might not make sense.",
+                stacklevel=2,
             )
-        return LetterCode(
-            NUCLEOTIDE_LETTER_CODES_COMPLEMENT.get(
-                self._letter_code, self._letter_code
-            ),
+        # the complement is copied from an already initialized (shared) LetterCode
+        # pylint: disable=protected-access
+        return _SHARED_LETTER_CODES[
+            self._letter_code.translate(_NUCLEOTIDE_COMPLEMENT_TRANSLATION),
             self._letter_type,
-        )
+        ]._copy(LetterCode)
+
+    def _copy(self, cls):
+        """
+        Modifiable copy of the current LetterCode, without going through __init__ again.
+
+        Parameters
+        ----------
+        cls : type
+            LetterCode (or subclass of) of the copy.
+
+        Returns
+        -------
+        LetterCode
+            Copy of current LetterCode.
+        """
+        # pylint: disable=protected-access
+        letter_code = object.__new__(cls)
+        letter_code._letter_code = self._letter_code
+        letter_code._letter_type = self._letter_type
+        letter_code._degenerate = self._degenerate
+        letter_code._supported = self._supported
+        letter_code._in_fasta_spec = self._in_fasta_spec
+        letter_code._shared = False
+        return letter_code
+
+    def _check_not_shared(self):
+        """
+        Shared LetterCode objects are used by every FastaSequence and, therefore, can't be modified.
+
+        Raises
+        ------
+        TypeError
+            If the LetterCode is shared.
+        """
+        if self._shared:
+            raise TypeError(
+                "LetterCode objects retrieved from a FastaSequence can't be modified. "
+                "Use LetterCode.from_lettercode() to get a modifiable copy"
+            )
 
     def _update_letter_type(self, letter_type):
         """
@@ -214,26 +278,12 @@ class LetterCode:
         TypeError
             If letter_type is of the wrong type.
         """
-        if letter_type in LETTER_CODES:
-            self._letter_type = letter_type
-
-            if (
-                self._letter_code in LETTER_CODES[self._letter_type][0]
-            ):  # letter_codes_good
-                self._degenerate = False
-                self._supported = True
-            elif (
-                self._letter_code in LETTER_CODES[self._letter_type][1]
-            ):  # letter_codes_degenerate
-                self._degenerate = True
-                self._supported = True
-            else:  # _letter_code isn't defined in the FASTA specification
-                self._degenerate = None
-                self._supported = False
-        elif letter_type is None:
+        if letter_type is None or letter_type in LETTER_CODES:
             self._letter_type = letter_type
-            self._supported = False
-            self._degenerate = None
+            # a single lookup instead of checking letter_codes_good and letter_codes_degenerate
+            _, self._degenerate, self._supported = _LETTER_CODE_PROPERTIES.get(
+                (self._letter_code, letter_type), _UNSUPPORTED_LETTER_CODE_PROPERTIES
+            )
         else:
             raise TypeError(
                 "letter_type must be one of: %s or None" % ", ".join(LETTER_CODES)
@@ -255,3 +305,21 @@ class LetterCode:
 
     def __str__(self):
         return self._letter_code
+
+
+class _SharedLetterCodes(dict):
+    """
+    Cache of shared (non modifiable) LetterCode objects, indexed by (letter_code, letter_type).
+    Only a handful of distinct letter codes exist, so FastaSequence objects reuse these instead of
+    building one LetterCode per position of the sequence.
+    LetterCode objects are built the first time they are requested.
+    """
+
+    def __missing__(self, key):
+        letter_code = LetterCode(*key)
+        letter_code._shared = True  # pylint: disable=protected-access
+        self[key] = letter_code
+        return letter_code
+
+
+_SHARED_LETTER_CODES = _SharedLetterCodes()
@@ -45,27 +45,20 @@ class ParseDefinitionLine:
         if isinstance(
             definition_line, str
         ):  # '>id|more_id description ...' with or without the '>' at the start
-            id_and_description = definition_line.split(
-                maxsplit=1
-            )  # first space separates id from description
+            definition_line = definition_line.lstrip()
+            if definition_line.startswith(">"):
+                definition_line = definition_line[1:]
 
-            # both id and description can be empty
-            if len(id_and_description) == 0 or (
-                len(id_and_description) == 1 and id_and_description[0] == ">"
-            ):
-                _id = ""
-                _description = ""
-            else:
-                if id_and_description[0].startswith(">"):
-                    id_and_description[0] = id_and_description[0][1:]
-                if (
-                    len(id_and_description) == 1
-                ):  # description can be empty (assumes only id present if len == 1)
-                    _id = id_and_description[0]
-                    _description = ""
+            # first space separates id from description (both can be empty)
+            _id, _, _description = definition_line.partition(" ")
+            # id and description might be separated by other whitespace (ex: '\t')
+            if not _id.isprintable():
+                if definition_line[0].isspace():
+                    _id, _description = "", definition_line
                 else:
-                    _id, _description = id_and_description
+                    _id, *_description = definition_line.split(None, 1)
+                    _description = _description[0] if _description else ""
         else:
             raise TypeError("definition_line must be str")
 
-        return _id, _description
+        return _id, _description.lstrip()
@@ -5,12 +5,31 @@
 Reader - FASTA parser/reader.
 """
 
+import codecs
+import io
+import mmap
 import os
 from collections import namedtuple
-from .constants import LETTER_CODES
+from .constants import LETTER_CODES, _SEQUENCE_TYPES
 from .fastasequence import FastaSequence
 from .parsedefinitionline import ParseDefinitionLine
 
+# whitespace removed from sequences (sequence lines, empty lines and line endings).
+# Same characters as str.strip() and str.split(), including the Unicode ones
+_WHITESPACE_TRANSLATION = str.maketrans(
+    "",
+    "",
+    " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000",
+)
+
+_SEQUENCES_TYPE_ERROR = "sequences_type must be one of: '%s' or None" % "', '".join(
+    LETTER_CODES
+)
+
+# for 'quick' parse method (created once, instead of for every Reader)
+_Fasta = namedtuple("Fasta", ["header", "sequence"])
+
 
 class Reader(ParseDefinitionLine):
     """
@@ -44,6 +63,7 @@ class Reader(ParseDefinitionLine):
     """
 
     _PARSE_METHODS = ("rich", "quick")
+    _CHUNK_SIZE = 1 << 20  # number of characters read from fasta_file at a time
 
     def __init__(
         self, fasta_file, sequences_type=None, infer_type=False, parse_method="rich"
@@ -73,28 +93,23 @@ class Reader(ParseDefinitionLine):
             If fasta_file, sequences_type, infer_type or parse_method are of the wrong type.
             If fasta_file is not a file object, is closed or is not readable.
         """
-        # for 'quick' parse method
-        self._fasta_sequence = namedtuple("Fasta", ["header", "sequence"])
-
         # assume it's a file object
-        if (
-            hasattr(fasta_file, "readline")
-            and hasattr(fasta_file, "closed")
-            and hasattr(fasta_file, "readable")
+        try:
+            fasta_file.readline  # pylint: disable=pointless-statement
+            closed = fasta_file.closed
+            readable = fasta_file.readable
+        except AttributeError:
+            raise TypeError("fasta_file must be a file object") from None
+        if closed or not readable():
+            raise TypeError("fasta_file must be opened for reading")
+        self._fasta_file = fasta_file
+
+        if sequences_type is None or (
+            isinstance(sequences_type, str) and sequences_type in _SEQUENCE_TYPES
         ):
-            if not fasta_file.closed and fasta_file.readable():
-                self._fasta_file = fasta_file
-            else:
-                raise TypeError("fasta_file must be opened for reading")
-        else:
-            raise TypeError("fasta_file must be a file object")
-
-        if (
-            isinstance(sequences_type, str) and sequences_type in LETTER_CODES
-        ) or sequences_type is None:
             self._sequences_type = sequences_type
         else:
-            raise TypeError("sequence_type must be one of: %s or None" % LETTER_CODES)
+            raise TypeError(_SEQUENCES_TYPE_ERROR)
 
         if isinstance(infer_type, bool):
             self._infer_type = infer_type
@@ -130,30 +145,161 @@ class Reader(ParseDefinitionLine):
         """return parse_method."""
         return self._parse_method
 
-    def _generate_fasta_sequence_object(self, sequence, definition_line):
+    def _generate_fasta_sequence(self, definition_line, sequence):
         """
-        Generates either a FastaSequence or a namedtuple('Fasta', ['header', 'sequence']) object,
-        based on the value of self._parse_method
+        Generates a FastaSequence object (for the 'rich' parse method).
+        The 'quick' parse method generates namedtuple('Fasta', ['header', 'sequence']) objects directly.
 
         Parameters
         ----------
-        sequence : str
-            Sequence as string.
         definition_line : str
             Definition line (id + description) including '>' at the beginning.
+        sequence : str
+            Sequence as string.
 
         Returns
         -------
-        FastaSequence or namedtuple('Fasta', ['header', 'sequence'])
+        FastaSequence
         """
-        if self._parse_method == "rich":
-            id_, description = self._parse_definition_line(definition_line)
-            fasta_sequence = FastaSequence(
-                sequence, id_, description, self._sequences_type, self._infer_type
-            )
-        else:  # 'quick'
-            fasta_sequence = self._fasta_sequence(definition_line, sequence)
-        return fasta_sequence
+        id_, description = self._parse_definition_line(definition_line)
+        return FastaSequence._from_reader(  # pylint: disable=protected-access
+            sequence, id_, description, self._sequences_type, self._infer_type
+        )
+
+    def _read_chunks(self, fasta_file):
+        """
+        Reads the contents of a FASTA file in chunks of (up to) _CHUNK_SIZE characters
+        (called by _split_fasta_records).
+        Regular files are memory mapped, so the OS pages them in directly instead of copying them into
+        the file object buffers. Other file objects (ex: io.StringIO or gzip.open() files, whose file descriptor
+        is the compressed file) are read with fasta_file.read().
+
+        Parameters
+        ----------
+        fasta_file : file object
+            An opened file handle.
+
+        Yields
+        ------
+        str
+            Non empty chunk of the FASTA file.
+        """
+        fasta_map = decoder = None
+        try:
+            # only text files directly on top of a file on disk
+            raw_file = fasta_file.buffer.raw
+            if type(raw_file) is io.FileIO:  # pylint: disable=unidiomatic-typecheck
+                # same universal newlines translation ('\r\n' and '\r' to '\n') done by text files
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder(fasta_file.encoding)(
+                        fasta_file.errors
+                    ),
+                    translate=True,
+                )
+                fasta_map = mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, LookupError, OSError, ValueError):
+            # not a text file over a raw file (AttributeError) or an empty file (ValueError)
+            pass
+
+        if fasta_map is None:
+            chunk = fasta_file.read(self._CHUNK_SIZE)
+            while chunk:
+                yield chunk
+                chunk = fasta_file.read(self._CHUNK_SIZE)
+            return
+
+        try:
+            with fasta_map:
+                for start in range(0, len(fasta_map), self._CHUNK_SIZE):
+                    chunk = decoder.decode(fasta_map[start : start + self._CHUNK_SIZE])
+                    # incomplete multibyte characters are only decoded with the next chunk
+                    if chunk:
+                        yield chunk
+                chunk = decoder.decode(b"", final=True)
+                if chunk:
+                    yield chunk
+        finally:
+            # the file object wasn't read, so it's left at the end as if it was (ex: for writing after)
+            if not fasta_file.closed:
+                fasta_file.seek(0, io.SEEK_END)
+
+    def _split_fasta_records(self, fasta_file):
+        """
+        Splits the contents of a FASTA file into FASTA records (called by _iter_fasta_file).
+        A FASTA record starts with a '>' at the start of a line (leading whitespace is ignored)
+        and ends right before the next one.
+        The file is read in chunks (see _read_chunks), which are split into records all at once,
+        instead of going through the file line by line.
+        Anything before the first record is ignored.
+
+        Parameters
+        ----------
+        fasta_file : file object
+            An opened file handle.
+
+        Yields
+        ------
+        str
+            FASTA record (definition line and sequence lines), without the starting '>'.
+        """
+        # parts of the record being read, None until the first record starts
+        record_parts = None
+        # end of the previous chunk, from its last '\n', when that line only had whitespace so far
+        # (it might still be a definition line). The file starts as if after a '\n'
+        line_start = "\n"
+
+        for chunk in self._read_chunks(fasta_file):
+            chunk = line_start + chunk
+            last_line = chunk.rfind("\n")
+            if last_line != -1 and chunk[last_line:].isspace():
+                chunk, line_start = chunk[:last_line], chunk[last_line:]
+            else:
+                line_start = ""
+
+            records = chunk.split("\n>")
+            if chunk.count(">") != len(records) - 1:
+                # a '>' that doesn't start a line, maybe a definition line after some whitespace
+                # (the first line continues the previous chunk, unless the chunk starts with '\n')
+                first_line, *lines = chunk.split("\n")
+                chunk = "\n".join(
+                    [first_line]
+                    + [
+                        line.lstrip() if line.lstrip().startswith(">") else line
+                        for line in lines
+                    ]
+                )
+                records = chunk.split("\n>")
+            if record_parts is not None:
+                record_parts.append(records[0])
+            for record in records[1:]:
+                if record_parts is not None:
+                    yield "".join(record_parts)
+                record_parts = [record]
+
+        if record_parts is not None:
+            yield "".join(record_parts)
+
+    @staticmethod
+    def _parse_fasta_record(record):
+        """
+        Splits a FASTA record into its definition line and sequence.
+
+        Parameters
+        ----------
+        record : str
+            FASTA record, without the starting '>'.
+
+        Returns
+        -------
+        (str, str)
+            Definition line (including '>' at the beginning) and sequence.
+            Whitespace and empty lines are removed from the sequence, which is not specified in the
+            FASTA specification, but is forgiven to badly constructed FASTA files.
+        """
+        definition_line, _, sequence = record.partition("\n")
+        return ">" + definition_line.rstrip(), sequence.translate(
+            _WHITESPACE_TRANSLATION
+        )
 
     def _iter_fasta_file(self, fasta_file):
         """
@@ -166,55 +312,33 @@ class Reader(ParseDefinitionLine):
         """
         fasta_file.seek(0)  # restart cursor position (just in case)
 
-        definition_line = ""
-        sequence = ""
-
-        parsing_fasta_sequence = False
-        for line in fasta_file:
-            line = line.strip()
-
-            # searching for '>' character at the start of a line
-            # following lines contain the sequence, so parsing_fasta_sequence becomes True
-            if not parsing_fasta_sequence:
-                if line.startswith(">"):
-                    definition_line = line
-                    parsing_fasta_sequence = True
+        # chosen once, instead of checking the parse method for every FASTA sequence
+        if self._parse_method == "rich":
+            generate_fasta_sequence_object = self._generate_fasta_sequence
+        else:  # 'quick'
+            generate_fasta_sequence_object = _Fasta
 
-            # in the middle of parsing a FASTA sequence
-            else:
-                # builds sequence string until a '>' is found.
-                # also ignores empty lines, which is not specified in the FASTA specification,
-                # but is forgiven to badly constructed FASTA files
-                if len(line) > 0 and line[0] != ">":
-                    sequence += line
-                elif len(line) > 0 and line[0] == ">":
-                    fasta_sequence = self._generate_fasta_sequence_object(
-                        sequence, definition_line
-                    )
-                    yield fasta_sequence
-
-                    # restart variables
-                    definition_line = line
-                    sequence = ""
-                    parsing_fasta_sequence = True
+        # (definition_line, sequence) tuples
+        records = map(self._parse_fasta_record, self._split_fasta_records(fasta_file))
+        record = next(records, None)
+        for next_record in records:
+            yield generate_fasta_sequence_object(*record)
+            record = next_record
 
         # end of file, therefore yield last FASTA sequence
-        if (
-            len(sequence) > 0
-        ):  # a FASTA sequence was actually parsed and were not just blank lines
-            fasta_sequence = self._generate_fasta_sequence_object(
-                sequence, definition_line
-            )
-            yield fasta_sequence
+        if record is not None:
+            if (
+                len(record[1]) > 0
+            ):  # a FASTA sequence was actually parsed and were not just blank lines
+                yield generate_fasta_sequence_object(*record)
 
     def __iter__(self):
         """
         Iterates over the FASTA file.
         Returns a new iterator of the file (from the beginning) every time __iter__ is called.
         """
-        if (
-            not self._fasta_file.closed and self._fasta_file.readable()
-        ):  # check if file is closed
+        # readable() was checked in __init__ and can't change while the file is open
+        if not self._fasta_file.closed:  # check if file is closed
             self._current_iterator = self._iter_fasta_file(self._fasta_file)
             return self._current_iterator
         raise TypeError("fasta_file must be opened for reading")
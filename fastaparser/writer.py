@@ -41,6 +41,9 @@ class Writer(ParseDefinitionLine):
         When calling writefastas(), if fasta_sequences is not iterable.
     """
 
+    # number of characters joined before writing them, in writefastas()
+    _WRITE_BUFFER_SIZE = 1 << 20
+
     def __init__(self, fasta_file):
         """
         Initializes file object (checks if fasta_file is a file object opened for writing).
@@ -57,17 +60,15 @@ class Writer(ParseDefinitionLine):
             If fasta_file is not a file object, is closed or is not writable.
         """
         # assume it's a file object
-        if (
-            hasattr(fasta_file, "writelines")
-            and hasattr(fasta_file, "closed")
-            and hasattr(fasta_file, "writable")
-        ):
-            if not fasta_file.closed and fasta_file.writable():
-                self._fasta_file = fasta_file
-            else:
-                raise TypeError("fasta_file must be opened for writing")
-        else:
-            raise TypeError("fasta_file must be a file object")
+        try:
+            fasta_file.writelines  # pylint: disable=pointless-statement
+            closed = fasta_file.closed
+            writable = fasta_file.writable
+        except AttributeError:
+            raise TypeError("fasta_file must be a file object") from None
+        if closed or not writable():
+            raise TypeError("fasta_file must be opened for writing")
+        self._fasta_file = fasta_file
 
     @property
     def fasta_file(self):
@@ -92,35 +93,19 @@ class Writer(ParseDefinitionLine):
         TypeError
             If fasta_sequence is of the wrong type.
         """
-        # either use the FastaSequence object directly
-        if isinstance(fasta_sequence, FastaSequence):
-            pass
-
-        # or create one with the provided header and sequence
-        elif (
-            isinstance(fasta_sequence, (tuple, list))
-            and len(fasta_sequence) == 2
-            and isinstance(fasta_sequence[0], str)
-            and isinstance(fasta_sequence[1], str)
-        ):
-            id_, description = self._parse_definition_line(fasta_sequence[0])
-            sequence = "".join(
-                fasta_sequence[1].split("\n")
-            )  # remove '\n's from sequence
-            fasta_sequence = FastaSequence(sequence, id_, description)
+        fasta_sequence = self._to_fasta_sequence(fasta_sequence)
 
-        else:
-            raise TypeError(
-                "fasta_sequence must be a FastaSequence object or a tuple (header : str, sequence : str)"
-            )
-
-        # write fasta to file
-        self._fasta_file.write(fasta_sequence.formatted_fasta() + "\n\n")
+        # write fasta to file (as formatted_fasta() + '\n\n'), block by block
+        self._fasta_file.writelines(
+            fasta_sequence._iter_formatted_fasta()  # pylint: disable=protected-access
+        )
+        self._fasta_file.write("\n")
 
     def writefastas(self, fasta_sequences):
         """
         Writes multiple FASTA sequences to the provided file.
-        Simply calls writefasta() for each object in fasta_sequences.
+        FASTA sequences are written as in writefasta(), but are joined and written together,
+        _WRITE_BUFFER_SIZE characters (or more) at a time.
         Open the file with mode 'a' if you want to append multiple sequences to an existing FASTA file.
 
         Parameters
@@ -137,15 +122,73 @@ class Writer(ParseDefinitionLine):
             If fasta_sequences is not iterable.
         """
         try:
-            iter(fasta_sequences)
+            fasta_sequences = iter(fasta_sequences)
         except TypeError as exc:
             raise TypeError(
                 "fasta_sequences must be an iterable of FastaSequence "
                 "objects or an iterable of tuples (header : str, sequence : str)"
             ) from exc
 
-        for fasta in fasta_sequences:
-            self.writefasta(fasta)
+        # pylint: disable=protected-access
+        buffer = []
+        buffer_size = 0
+        try:
+            for fasta in fasta_sequences:
+                fasta_sequence = self._to_fasta_sequence(fasta)
+                for block in fasta_sequence._iter_formatted_fasta():
+                    buffer.append(block)
+                    buffer_size += len(block)
+                buffer.append("\n")
+
+                if buffer_size >= self._WRITE_BUFFER_SIZE:
+                    # emptied before writing, so a failed write isn't repeated by the finally block
+                    text = "".join(buffer)
+                    buffer = []
+                    buffer_size = 0
+                    self._fasta_file.write(text)
+        finally:  # FASTA sequences before a wrong one are still written
+            if buffer:
+                self._fasta_file.write("".join(buffer))
+
+    @staticmethod
+    def _to_fasta_sequence(fasta_sequence):
+        """
+        Checks fasta_sequence and converts it to a FastaSequence object, if needed.
+
+        Parameters
+        ----------
+        fasta_sequence : FastaSequence or (header : str, sequence : str)
+            FastaSequence object or tuple of header + sequence.
+
+        Returns
+        -------
+        FastaSequence
+
+        Raises
+        ------
+        TypeError
+            If fasta_sequence is of the wrong type.
+        """
+        # either use the FastaSequence object directly
+        if isinstance(fasta_sequence, FastaSequence):
+            pass
+
+        # or create one with the provided header and sequence
+        elif (
+            isinstance(fasta_sequence, (tuple, list))
+            and len(fasta_sequence) == 2
+            and isinstance(fasta_sequence[0], str)
+            and isinstance(fasta_sequence[1], str)
+        ):
+            id_, description = Writer._parse_definition_line(fasta_sequence[0])
+            sequence = fasta_sequence[1].replace("\n", "")  # remove '\n's from sequence
+            fasta_sequence = FastaSequence(sequence, id_, description)
+
+        else:
+            raise TypeError(
+                "fasta_sequence must be a FastaSequence object or a tuple (header : str, sequence : str)"
+            )
+        return fasta_sequence
 
     def __repr__(self):
         return "fastaparser.Writer(%s)" % os.path.abspath(self._fasta_file.name)
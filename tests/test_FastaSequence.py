@@ -168,6 +168,12 @@ class Test__init__:
         with pytest.raises(TypeError):
             FastaSequence("")
 
+    def test_sequence_upper_case_not_single_character(self):
+        # 'ß'.upper() == 'SS'
+        with pytest.raises(TypeError):
+            FastaSequence("aß")
+        assert FastaSequence("aé").sequence_as_string() == "AÉ"
+
     def test_sequence_lower_case(self):
         fasta_sequence = FastaSequence("".join(NUCLEOTIDE_LETTER_CODES_GOOD).lower())
         correct_sequence = [
@@ -205,6 +211,14 @@ class Test__init__:
         assert fasta_sequence.sequence_type is None
         assert fasta_sequence.inferred_type is False
 
+    def test_id_str_subclass(self):
+        class IdStr(str):
+            pass
+
+        fasta_sequence = FastaSequence("ACTG", id_=IdStr("some_id"))
+        assert fasta_sequence.id == "some_id"
+        assert type(fasta_sequence.id) is str
+
     def test_id_not_str(self):
         with pytest.raises(TypeError):
             fasta_sequence = FastaSequence("ACTG", id_=1)
@@ -321,6 +335,12 @@ class Test__init__:
         assert fasta_sequence.description == ""
         assert fasta_sequence.sequence_type == "aminoacid"
         assert fasta_sequence.inferred_type is True
+        # lower case aminoacid sequence
+        fasta_sequence = FastaSequence(
+            "".join(AMINOACID_LETTER_CODES_GOOD).lower(), infer_type=True
+        )
+        assert fasta_sequence.sequence_type == "aminoacid"
+        assert fasta_sequence.inferred_type is True
 
     # def test_infer_type_false (already tested)
 
@@ -345,6 +365,13 @@ class Test__init__:
         fasta_sequence = FastaSequence(sequence)
         assert fasta_sequence._counts == {"A": len(sequence)}
 
+    def test_counts_computed_when_needed(self):
+        fasta_sequence = FastaSequence("ACGTA")
+        assert fasta_sequence._letter_code_counts is None
+        assert fasta_sequence._counts == {"A": 2, "C": 1, "G": 1, "T": 1}
+        assert fasta_sequence._letter_code_counts is fasta_sequence._counts
+        assert fasta_sequence[1:3]._letter_code_counts is None
+
     def test_counts_letter_codes_unknown(
         self, letter_codes_unknown, unknown_characters
     ):
@@ -373,6 +400,14 @@ class Test_from_fastasequence:
         assert new.sequence_type == original.sequence_type
         assert new.inferred_type == original.inferred_type
 
+    def test_id_not_cleaned_again(self):
+        # copies, slices and complements keep the already cleaned id as is
+        original = FastaSequence("ACGT", id_=">>id", sequence_type="nucleotide")
+        assert original.id == ">id"
+        assert FastaSequence.from_fastasequence(original).id == ">id"
+        assert original[1:].id == ">id"
+        assert original.complement().id == ">id"
+
     def test_fastasequence_wrong_type(self):
         with pytest.raises(TypeError):
             FastaSequence.from_fastasequence("ACTG")
@@ -482,6 +517,37 @@ class Test_description_property:
         assert fasta_sequence.inferred_type is False
 
 
+class Test_sequence_property:
+    def test_sequence_as_letter_codes(self, nucleotide_good):
+        fasta_sequence, correct_sequence = nucleotide_good
+        assert len(fasta_sequence.sequence) == len(correct_sequence)
+        assert list(fasta_sequence.sequence) == correct_sequence
+        assert fasta_sequence.sequence[1:3] == correct_sequence[1:3]
+        assert isinstance(fasta_sequence.sequence[1:3], list)
+        assert fasta_sequence.sequence[0].letter_type == "nucleotide"
+
+    def test_letter_codes_follow_sequence_type(self, nucleotide_good):
+        fasta_sequence = nucleotide_good[0]
+        fasta_sequence.sequence_type = "aminoacid"
+        assert all(
+            letter_code.letter_type == "aminoacid"
+            for letter_code in fasta_sequence.sequence
+        )
+
+    def test_letter_codes_shared(self, nucleotide_good):
+        fasta_sequence = nucleotide_good[0]
+        other_fasta_sequence = FastaSequence("TTA", sequence_type="nucleotide")
+        assert fasta_sequence.sequence[0] is other_fasta_sequence.sequence[-1]
+        with pytest.raises(TypeError):
+            fasta_sequence.sequence[0].letter_type = "aminoacid"
+        with pytest.raises(TypeError):
+            del fasta_sequence.sequence[0].letter_type
+        copy = LetterCode.from_lettercode(fasta_sequence.sequence[0])
+        copy.letter_type = "aminoacid"
+        assert copy.letter_type == "aminoacid"
+        assert fasta_sequence.sequence[0].letter_type == "nucleotide"
+
+
 class Test_sequence_type_property:
     def test_set_nucleotide(self, aminoacid_good):
         fasta_sequence, correct_sequence = aminoacid_good
@@ -675,6 +741,12 @@ class Test_gc_content:
         assert fasta_sequence.gc_content() == 2 / len(fasta_sequence.sequence)
         assert fasta_sequence._gc == 2
 
+    def test_gc_content_already_set_zero(self, nucleotide_good):
+        fasta_sequence = nucleotide_good[0]  # ACGTNU
+        fasta_sequence._gc = 0  # a computed 0 is kept as well
+        assert fasta_sequence.gc_content() == 0
+        assert fasta_sequence._gc == 0
+
     # def test_as_percentage_True (already tested)
     # def test_as_percentage_False (already tested)
 
@@ -789,6 +861,13 @@ class Test_at_gc_ratio:
         assert fasta_sequence._at == 2
         assert fasta_sequence._gc == 2
 
+    def test_at_already_set_zero(self, nucleotide_good):
+        fasta_sequence = nucleotide_good[0]  # ACGTNU
+        fasta_sequence._at = 0  # a computed 0 is kept as well
+        assert fasta_sequence.at_gc_ratio() == 0
+        assert fasta_sequence._at == 0
+        assert fasta_sequence._gc == 2
+
     def test_gc_already_set(self, nucleotide_good):
         fasta_sequence = nucleotide_good[0]  # ACGTNU
         fasta_sequence._gc = 3  # would have been 2, by default
@@ -1051,24 +1130,6 @@ class Test_reverse:
             pytest.fail("FastaSequence.reverse() is not iterable.")
 
 
-class Test_update_sequence_type:
-    def test_update_sequence_type_update_letter_code_objects_not_bool(
-        self, nucleotide_good
-    ):
-        fasta_sequence = nucleotide_good[0]
-        with pytest.raises(TypeError):
-            fasta_sequence._update_sequence_type(
-                "aminoacid", update_letter_code_objects=" "
-            )
-        with pytest.raises(TypeError):
-            fasta_sequence._update_sequence_type(
-                "aminoacid", update_letter_code_objects=[]
-            )
-
-    # def test_update_sequence_type_good (already tested)
-    # def test_update_sequence_type_wrong_type (already tested)
-
-
 class Test__iter__:
     def test__iter__(self, nucleotide_good):
         fasta_sequence = nucleotide_good[0]
@@ -1193,6 +1254,14 @@ class Test__getitem__:
             == fasta_sequence._sequence[-1]
         )
 
+    def test_get_element_with_index_object(self, nucleotide_good):
+        class Index:
+            def __index__(self):
+                return 2
+
+        fasta_sequence = nucleotide_good[0]
+        assert fasta_sequence[Index()] == fasta_sequence[2] == nucleotide_good[1][2]
+
     def test_get_slice_single(self, nucleotide_good):
         fasta_sequence = nucleotide_good[0]
 
@@ -1304,6 +1373,8 @@ class Test__eq__:
         }
         assert fasta_sequence != {}
         assert fasta_sequence != LetterCode("A")
+        # lets the other object's __eq__ decide
+        assert fasta_sequence.__eq__(1) is NotImplemented
 
 
 class Test__len__:
@@ -1331,5 +1402,5 @@ class Test__str__:
 # tested in Test__Init__:
 #   class Test_id_property
 #   class Test_description_property
-#   class Test_sequence_property
 #   class Test_inferred_type
+#   class Test_update_sequence_type
@@ -298,6 +298,14 @@ class Test_complement:
             assert complement.supported is False
             assert complement.in_fasta_spec is False
 
+    def test_complement_is_modifiable(self, nucleotide_good):
+        complement = nucleotide_good.complement()
+        assert complement is not nucleotide_good.complement()
+        complement.letter_type = "aminoacid"
+        assert complement.letter_type == "aminoacid"
+        assert complement.description == "threonine"
+        assert nucleotide_good.complement().letter_type == "nucleotide"
+
 
 class Test__eq__:
     def test_lettercode(self, nucleotide_good):
@@ -46,6 +46,9 @@ class Test_parse_definition_line:
         definition_line_test_function(
             "id              description abc", "id", "description abc"
         )
+        # other whitespace before description
+        definition_line_test_function("id\t description\tabc", "id", "description\tabc")
+        definition_line_test_function(">\tdescription abc", "", "description abc")
 
     def test_definition_line_id(self, definition_line_test_function):
         definition_line = ">ID123|secondID|otherID"
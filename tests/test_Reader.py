@@ -6,6 +6,9 @@ Tests for fastaparser.Reader class.
 """
 
 
+import bz2
+import gzip
+import io
 import os
 import pytest
 from fastaparser import Reader
@@ -385,6 +388,8 @@ class Test__iter__:
                 )
             )
         assert len(fastas_aminoacid) == 20
+        # every Reader generates the same namedtuple type
+        assert type(fastas_nucleotide[0]) is type(fastas_aminoacid[0])
 
     def test_empty_lines_between_fastas(
         self, fasta_multiple_empty_lines, fasta_multiple_empty_lines_contents
@@ -440,6 +445,92 @@ class Test__iter__:
             )
         assert len(fastas) == 2
 
+    def test_chunk_boundaries(
+        self, monkeypatch, fasta_nucleotide_multiple, fasta_nucleotide_multiple_contents
+    ):
+        # records and definition lines split between chunks
+        for chunk_size in (1, 2, 3, 7, 64):
+            monkeypatch.setattr(Reader, "_CHUNK_SIZE", chunk_size)
+            fasta_reader = Reader(fasta_nucleotide_multiple, parse_method="quick")
+            fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+            assert fastas == [
+                (">%s %s" % (id_, description), sequence)
+                for id_, description, sequence in fasta_nucleotide_multiple_contents
+            ]
+
+    def test_whitespace_in_sequence(self):
+        fasta_file = io.StringIO(
+            "ignored text\n>id1 description\r\nAC GT\r\n\tACGT\n\n>id2\nA C\n"
+        )
+        fasta_reader = Reader(fasta_file, parse_method="quick")
+        fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+        assert fastas == [(">id1 description", "ACGTACGT"), (">id2", "AC")]
+
+    def test_unicode_whitespace_in_sequence(self):
+        fasta_file = io.StringIO(">id1\nAC\xa0GT\u2003\n\x85ACGT\n\xa0\n>id2\nA\n")
+        fasta_reader = Reader(fasta_file, parse_method="quick")
+        fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+        assert fastas == [(">id1", "ACGTACGT"), (">id2", "A")]
+        # a sequence with only whitespace is empty
+        with pytest.raises(TypeError):
+            list(Reader(io.StringIO(">id1\n\xa0\n>id2\nA\n")))
+
+    def test_indented_definition_line(self, monkeypatch):
+        fasta_contents_text = ">a\nAC\n  >b x>y\nGG\n\t>c\nT >T\n \n >d\nA"
+        # indentation split between chunks
+        for chunk_size in (1, 2, 3, 64):
+            monkeypatch.setattr(Reader, "_CHUNK_SIZE", chunk_size)
+            fasta_reader = Reader(
+                io.StringIO(fasta_contents_text), parse_method="quick"
+            )
+            fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+            assert fastas == [
+                (">a", "AC"),
+                (">b x>y", "GG"),
+                (">c", "T>T"),
+                (">d", "A"),
+            ]
+
+    def test_memory_mapped_file(self, monkeypatch, tmp_path):
+        fasta_path = tmp_path / "fasta_file.fasta"
+        fasta_path.write_bytes(
+            ">id1 descrição\r\nACGT\r\nAC\r>id2 €\nACGT\n".encode("utf-8")
+        )
+        # multibyte characters split between chunks
+        for chunk_size in (1, 2, 3, 64):
+            monkeypatch.setattr(Reader, "_CHUNK_SIZE", chunk_size)
+            with open(fasta_path, encoding="utf-8") as fasta_file:
+                fasta_reader = Reader(fasta_file, parse_method="quick")
+                fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+            assert fastas == [(">id1 descrição", "ACGTAC"), (">id2 €", "ACGT")]
+
+    def test_memory_mapped_file_write_after(self, tmp_path):
+        fasta_path = tmp_path / "fasta_file.fasta"
+        with open(fasta_path, "w+") as fasta_file:
+            fasta_file.write(">a\nACGT\n")
+            assert [fasta.id for fasta in Reader(fasta_file)] == ["a"]
+            fasta_file.write(">b\nTT\n")
+            # partially iterated
+            fasta_reader = Reader(fasta_file)
+            next(fasta_reader)
+            fasta_reader._current_iterator.close()
+            fasta_file.write(">c\nG\n")
+        assert fasta_path.read_text() == ">a\nACGT\n>b\nTT\n>c\nG\n"
+
+    def test_compressed_file(self, tmp_path):
+        # compressed files have a file descriptor too, but it can't be memory mapped
+        fasta_contents_text = ">id1 descrição\nACGT\nAC\n>id2\nACGT\n"
+        for compression in (gzip, bz2):
+            fasta_path = tmp_path / ("fasta_file.fasta." + compression.__name__)
+            with compression.open(fasta_path, "wt", encoding="utf-8") as fasta_file:
+                fasta_file.write(fasta_contents_text)
+            with compression.open(fasta_path, "rt", encoding="utf-8") as fasta_file:
+                fasta_reader = Reader(fasta_file, parse_method="quick")
+                fastas = [(fasta.header, fasta.sequence) for fasta in fasta_reader]
+            assert fastas == [(">id1 descrição", "ACGTAC"), (">id2", "ACGT")]
+            with compression.open(fasta_path, "rt", encoding="utf-8") as fasta_file:
+                assert [fasta.id for fasta in Reader(fasta_file)] == ["id1", "id2"]
+
 
 class Test__next__:
     def test_existing_current_iterator(
@@ -7,9 +7,10 @@ Tests for fastaparser.Writer class.
 
 
 import hashlib
+import io
 import os
 import pytest
-from fastaparser import Reader, Writer
+from fastaparser import FastaSequence, Reader, Writer
 
 
 ##########
@@ -86,6 +87,15 @@ class Test_writefasta:
         # at this point the 2 files should be equal
         compare_2_files(fasta_nucleotide_single, fasta_temporary_file)
 
+    def test_fasta_sequence_multiple_blocks(self, monkeypatch):
+        # sequence written in blocks of 2 lines
+        monkeypatch.setattr(FastaSequence, "_LINES_PER_BLOCK", 2)
+        for sequence_length in (1, 70, 140, 141, 500):
+            fasta = FastaSequence("A" * sequence_length, "id", "description")
+            fasta_file = io.StringIO()
+            Writer(fasta_file).writefasta(fasta)
+            assert fasta_file.getvalue() == fasta.formatted_fasta() + "\n\n"
+
     def test_fasta_sequence_wrong_type(self, fasta_temporary_file):
         with pytest.raises(TypeError):
             fasta_writer = Writer(fasta_temporary_file)
@@ -124,6 +134,37 @@ class Test_writefastas:
         # at this point the 2 files should be equal
         compare_2_files(fasta_nucleotide_multiple, fasta_temporary_file)
 
+    def test_fasta_sequence_generator(self, monkeypatch):
+        fastas = [FastaSequence("ACGT" * i, "id%d" % i) for i in range(1, 50)]
+        expected = "".join(fasta.formatted_fasta() + "\n\n" for fasta in fastas)
+        # written all at once or every few FASTA sequences
+        for write_buffer_size in (1 << 20, 1, 100):
+            monkeypatch.setattr(Writer, "_WRITE_BUFFER_SIZE", write_buffer_size)
+            fasta_file = io.StringIO()
+            Writer(fasta_file).writefastas(fasta for fasta in fastas)
+            assert fasta_file.getvalue() == expected
+
+    def test_fasta_sequence_wrong_type_after_good(self):
+        fasta = FastaSequence("ACGT", "id")
+        fasta_file = io.StringIO()
+        with pytest.raises(TypeError):
+            Writer(fasta_file).writefastas([fasta, 1])
+        # FASTA sequences before the wrong one are still written
+        assert fasta_file.getvalue() == fasta.formatted_fasta() + "\n\n"
+
+    def test_failed_write_not_repeated(self, monkeypatch):
+        class FailingFile(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                FailingFile.writes += 1
+                raise OSError("disk full")
+
+        monkeypatch.setattr(Writer, "_WRITE_BUFFER_SIZE", 1)
+        with pytest.raises(OSError):
+            Writer(FailingFile()).writefastas([FastaSequence("ACGT", "id")] * 2)
+        assert FailingFile.writes == 1
+
     def test_fasta_sequence_wrong_type(self, fasta_temporary_file):
         with pytest.raises(TypeError):
             fasta_writer = Writer(fasta_temporary_file)